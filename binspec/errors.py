@@ -1,12 +1,24 @@
-class SpecError(BaseException):
+class SpecError(Exception):
   def __init__(self, reason):
-    super().__init__(f"Specification Error: {reason}")
+    super().__init__(reason)
+    self.reason = reason
 
-class SpecEofError(BaseException):
+  def __str__(self):
+    return f"Specification Error: {self.reason}"
+
+class SpecEofError(Exception):
   def __init__(self, reason):
-    super().__init__(f"Unexpected EOF: {reason}")
+    super().__init__(reason)
+    self.reason = reason
+
+  def __str__(self):
+    return f"Unexpected EOF: {self.reason}"
 
-class SpecTypeError(BaseException):
+class SpecTypeError(Exception):
   def __init__(self, reason, spec_type):
-    super().__init__(
-        f"Specification Type Error: {reason} [{type(spec_type).__name__}]")
\ No newline at end of file
+    super().__init__(reason)
+    self.reason = reason
+    self.spec_type = spec_type
+
+  def __str__(self):
+    return f"Specification Type Error: {self.reason} [{type(self.spec_type).__name__}]"
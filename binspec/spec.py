@@ -1,6 +1,7 @@
 from io import BytesIO
 from .types import SpecType
 from .errors import SpecError, SpecTypeError, SpecEofError
+from .utilities.utilities import _BIT_LUT, expand_bits
 from typing import Union, Callable, Any
 
 
@@ -14,13 +15,55 @@ class Specification:
   :param track_history: flag whether to keep track of SpecTypes passed to expect(...).
   :param middleware: callable invoked whenever a SpecType successfully parses a value."""
   def __init__(self, stream: Union[BytesIO, bytes, bytearray], *, track_history: bool=True, middleware: Callable[SpecType, Any]=None):
-    if isinstance(stream, bytes) or isinstance(stream, bytearray):
-      stream = BytesIO(stream)
-
-    self.stream: BytesIO = stream
     self.middleware: Callable[SpecType, Any] = middleware
 
-    self.__history = [] if track_history else None
+    # In-memory sources are indexed directly instead of paying a
+    # stream.read method call (and its internal bookkeeping) per take.
+    if isinstance(stream, (bytes, bytearray, memoryview)):
+      # Raw input skips the BytesIO wrap entirely; constructing one would
+      # copy the data into the stream just to copy it back out.
+      self.stream: BytesIO = None
+      self.__buf = bytes(stream)
+      # Slicing one long-lived memoryview serves every take as a zero-copy
+      # window of the buffer.
+      self.__view = memoryview(self.__buf)
+      self.__pos = 0
+    elif isinstance(stream, BytesIO):
+      self.stream: BytesIO = stream
+      self.__buf = stream.getvalue()
+      self.__view = memoryview(self.__buf)
+      self.__pos = stream.tell()
+    else:
+      self.stream: BytesIO = stream
+      self.__buf = None
+      self.__view = None
+      self.__pos = 0
+      # Streamed sources are drained through a chunked refill buffer so
+      # each take is a slice of it instead of a read against the source.
+      self.__chunk = b""
+      self.__chunk_pos = 0
+
+    # Bit-expanded copy of the whole buffer, built lazily on the first
+    # non-byte-aligned read so later ones are plain slices.
+    self.__expanded = None
+
+    # The history is stored as three parallel lists rather than a list of
+    # tuples; this avoids a tuple allocation per expect and lets consumers
+    # that only need one field (like ui.show) walk a single list.
+    if track_history:
+      self.__history_types = []
+      self.__history_values = []
+      self.__history_labels = []
+    else:
+      self.__history_types = None
+      self.__history_values = None
+      self.__history_labels = None
+
+      if middleware is None:
+        # With history and middleware both off there is no per-parse
+        # bookkeeping; bind the stripped-down variant so expect does not
+        # re-check that on every call.
+        self.expect = self.__expect_plain
 
     self.__bit_offset = 0
     self.__byte_offset = 0
@@ -30,11 +73,14 @@ class Specification:
     """Get the SpecType history of this Specification. This is a list of tuples  If the track_history attribute is false, this method will return an empty array.
 
     :return: List of tuples containing the SpecType, its parsed value, and the optionally proivded label."""
-    return self.__history
+    if self.__history_types is None:
+      return []
+
+    return list(zip(self.__history_types, self.__history_values, self.__history_labels))
 
   def is_history_enabled(self):
     """:return: Whether history tracking is enabled (track_history=True was passed to the constructor)."""
-    return self.__history is not None
+    return self.__history_types is not None
 
   def expect(self, spec_type: SpecType, *, none_at_eof: bool=False, label: Union[str, None]=None) -> Any:
     """Use the specified :class:`SpecType` to parse from the bytes stream.
@@ -47,68 +93,239 @@ class Specification:
     :param label: An optional label to attach to the :class:`SpecType` when it is added to the history (only if history tracking is enabled). Can realistically be any object as it is added to a tuple and never touched again.
     
     :return: A corresponding python object to the given :class:`SpecType`."""
-    bit_length = spec_type.get_bit_length()
+    # Built-in SpecTypes cache their bit length as a plain attribute; only
+    # custom SpecTypes without one pay the get_bit_length dispatch.
+    bit_length = getattr(spec_type, "bit_length", None)
+
+    if bit_length is None:
+      bit_length = spec_type.get_bit_length()
 
     if bit_length < 0:
       raise SpecTypeError("Bit length cannot be negative.", spec_type)
 
-    bits = self.__take_bits(bit_length, none_at_eof)
+    if bit_length % 8 == 0 and self.__is_byte_aligned():
+      raw = self.__take_bytes(bit_length // 8, none_at_eof)
 
-    if bits == None:
-      return None
+      if raw is None:
+        return None
 
-    value = spec_type.parse(bits)
+      value = spec_type.parse_bytes(raw)
+    else:
+      bits = self.__take_bits(bit_length, none_at_eof)
 
-    if self.is_history_enabled(): 
-      self.__history.append((spec_type, value, label))
-    
-    if self.middleware is not None: 
+      if bits is None:
+        return None
+
+      value = spec_type.parse(bits)
+
+    history_types = self.__history_types
+
+    if history_types is not None:
+      history_types.append(spec_type)
+      self.__history_values.append(value)
+      self.__history_labels.append(label)
+
+    middleware = self.middleware
+
+    if middleware is not None:
       middleware(spec_type, value)
 
     return value
 
+  def __expect_plain(self, spec_type: SpecType, *, none_at_eof: bool=False, label: Union[str, None]=None) -> Any:
+    # Bound over expect in __init__ for Specifications without history or
+    # middleware: the same read paths minus all of the bookkeeping.
+    bit_length = getattr(spec_type, "bit_length", None)
+
+    if bit_length is None:
+      bit_length = spec_type.get_bit_length()
+
+    if bit_length < 0:
+      raise SpecTypeError("Bit length cannot be negative.", spec_type)
+
+    if bit_length % 8 == 0 and self.__is_byte_aligned():
+      raw = self.__take_bytes(bit_length // 8, none_at_eof)
+
+      if raw is None:
+        return None
+
+      return spec_type.parse_bytes(raw)
+
+    bits = self.__take_bits(bit_length, none_at_eof)
+
+    if bits is None:
+      return None
+
+    return spec_type.parse(bits)
+
+  def expect_many(self, spec_types: list[SpecType], *, none_at_eof: bool=False, labels: Union[list[str], None]=None) -> list[Any]:
+    """Use several :class:`SpecType`s to parse from the bytes stream with a single read. The per-expect fixed cost (length lookup, stream take, bookkeeping) is paid once for the whole batch instead of once per SpecType.
+
+    Arguments:
+    :param spec_types: The :class:`SpecType`s to parse, in order.
+
+    Keyword Arguments
+    :param none_at_eof: If false, this method will raise a SpecError when attempting to read past the end of the stream. If true, this method will return None instead.
+    :param labels: An optional list of labels corresponding to `spec_types`, attached to the history like the label argument of expect. Must be the same length as `spec_types`.
+
+    :return: A list of parsed python objects, one per :class:`SpecType`."""
+    spec_types = list(spec_types)
+
+    if labels is not None and len(labels) != len(spec_types):
+      raise SpecError("spec_types and labels must be the same length.")
+
+    total = 0
+    lengths = []
+
+    for spec_type in spec_types:
+      bit_length = getattr(spec_type, "bit_length", None)
+
+      if bit_length is None:
+        bit_length = spec_type.get_bit_length()
+
+      if bit_length < 0:
+        raise SpecTypeError("Bit length cannot be negative.", spec_type)
+
+      lengths.append(bit_length)
+      total += bit_length
+
+    bits = self.__take_bits(total, none_at_eof)
+
+    if bits is None:
+      return None
+
+    view = memoryview(bits)
+    history_types = self.__history_types
+    middleware = self.middleware
+    values = []
+    offset = 0
+
+    for i, spec_type in enumerate(spec_types):
+      value = spec_type.parse(view[offset:offset + lengths[i]])
+      offset += lengths[i]
+      values.append(value)
+
+      if history_types is not None:
+        history_types.append(spec_type)
+        self.__history_values.append(value)
+        self.__history_labels.append(labels[i] if labels is not None else None)
+
+      if middleware is not None:
+        middleware(spec_type, value)
+
+    return values
+
   def assert_eof(self) -> None:
     """Check if there are more bytes left in the stream and raise a SpecEofError if not."""
-    if len(self.stream.read(1)) > 0:
+    if self.__buf is not None:
+      if self.__pos < len(self.__buf):
+        raise SpecEofError(f"Expected end of file after {self.__byte_offset} bytes.")
+
+      return
+
+    if self.__chunk_pos < len(self.__chunk) or len(self.stream.read(1)) > 0:
       raise SpecEofError(f"Expected end of file after {self.__byte_offset} bytes.")
 
+  def __is_byte_aligned(self) -> bool:
+    return (self.__current_byte == -1 and self.__bit_offset == 0) or self.__bit_offset == 8
+
+  def __take_bytes(self, byte_count: int, none_at_eof: bool) -> bytes:
+    if self.__buf is not None:
+      pos = self.__pos
+      end = pos + byte_count
+
+      if end > len(self.__buf):
+        if none_at_eof:
+          return None
+
+        raise SpecEofError(f"Ran out of bytes. Expected byte after {self.__byte_offset} bytes.")
+
+      self.__pos = end
+      self.__byte_offset += byte_count
+
+      return self.__view[pos:end]
+
+    while len(self.__chunk) - self.__chunk_pos < byte_count:
+      read = self.stream.read(max(byte_count, 8192))
+
+      if not read:
+        if none_at_eof:
+          return None
+
+        raise SpecEofError(f"Ran out of bytes. Expected byte after {self.__byte_offset} bytes.")
+
+      self.__chunk = self.__chunk[self.__chunk_pos:] + read
+      self.__chunk_pos = 0
+
+    pos = self.__chunk_pos
+    self.__chunk_pos = pos + byte_count
+    self.__byte_offset += byte_count
+
+    return self.__chunk[pos:pos + byte_count]
+
   def __take_bits(self, count: int, none_at_eof: bool) -> list[int]:
-    def next_byte():
-      nonlocal none_at_eof
-      
-      try:
-        self.__current_byte = self.stream.read(1)[0]
-      except IndexError as err:
+    # Buffered sources expand the entire buffer once (lazily) so every bit
+    # read, aligned or not, is a slice plus cursor arithmetic.
+    if self.__buf is not None:
+      if self.__expanded is None:
+        self.__expanded = expand_bits(self.__buf)
+
+      start = self.__pos * 8 - (8 - self.__bit_offset if self.__bit_offset else 0)
+      end = start + count
+
+      if end > len(self.__expanded):
         if none_at_eof:
-          self.__current_byte = None
-          return
-        
-        raise SpecEofError(f"Ran out of bytes. Expected byte after {self.__byte_offset} bytes.") from err
-    
-    if self.__current_byte == -1:
-      next_byte()
-        
-      if self.__current_byte is None:
-        return None
-    
-    bits = bytearray()
-    
-    while count > 0:
-      count -= 1
-      
-      if self.__bit_offset == 8:
-        self.__bit_offset = 0
-        next_byte()
-
-        if self.__current_byte is None:
           return None
-      
-      # Return raw order of original bits
-      bit = (self.__current_byte << self.__bit_offset) & 128
-      bits.append(bit >> 7) # shift last bit to first position to return a 1
-      self.__bit_offset += 1
 
-    return bytes(bits)
+        raise SpecEofError(f"Ran out of bytes. Expected byte after {self.__byte_offset} bytes.")
+
+      self.__pos = (end + 7) // 8
+      self.__byte_offset = self.__pos
+      self.__bit_offset = end % 8 or 8
+      self.__current_byte = self.__buf[self.__pos - 1] if self.__pos > 0 else -1
+
+      return self.__expanded[start:end]
+
+    # Fast path: when the cursor is byte-aligned and a whole number of bytes is
+    # requested, read them in bulk instead of looping over individual bits.
+    if count % 8 == 0 and self.__is_byte_aligned():
+      buf = self.__take_bytes(count // 8, none_at_eof)
+
+      if buf is None:
+        return None
+
+      return expand_bits(buf)
+
+    # Preallocate the full accumulator and fill it with slice assignments
+    # (memcpy under the hood) instead of growing a bytearray as bits arrive.
+    out = bytearray(count)
+    out_pos = 0
+
+    # Drain whatever the current byte still holds.
+    if 0 < self.__bit_offset < 8:
+      take = min(8 - self.__bit_offset, count)
+      out[:take] = _BIT_LUT[self.__current_byte][self.__bit_offset:self.__bit_offset + take]
+      self.__bit_offset += take
+      count -= take
+      out_pos = take
+
+    if count == 0:
+      return bytes(out)
+
+    # Pull every remaining byte in one read and expand them in one pass
+    # instead of fetching and shifting byte by byte.
+    byte_count = (count + 7) // 8
+    buf = self.__take_bytes(byte_count, none_at_eof)
+
+    if buf is None:
+      return None
+
+    out[out_pos:] = expand_bits(buf)[:count]
+
+    self.__current_byte = buf[-1]
+    self.__bit_offset = count % 8 or 8
+
+    return bytes(out)
 
   def fail(self, reason: str="Manual failure.") -> None:
     """Manually raise a SpecError with the given reason."""
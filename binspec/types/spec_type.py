@@ -1,28 +1,44 @@
-from abc import abstractmethod
+import codecs
 from ..errors import SpecError, SpecTypeError
-from ..utilities import bits_to_int, bits_to_bytes
-from typing import Union, Any
-import math
-from itertools import tee, islice
+from ..utilities import bits_to_int, bits_to_bytes, expand_bits, reverse_bits
+from ..utilities.utilities import _BITREV
+from typing import Union, Callable, Any
+import struct
+from itertools import accumulate
 
 
 class SpecType:
   """Base class for parsable binary types."""
-  @abstractmethod
+  # The base carries no state of its own; declaring empty slots keeps it from
+  # adding a __dict__ to subclasses that opt into slots themselves.
+  __slots__ = ()
+
   def get_bit_length(self) -> int:
-    """:return: The number of bits to parse and pass to this SpecType."""
-    raise NotImplementedError("SpecType.get_bit_length not implemented.")
+    """:return: The number of bits to parse and pass to this SpecType. Built-in SpecTypes compute this once in __init__ and store it on the bit_length attribute, which this returns."""
+    return self.bit_length
 
-  @abstractmethod
   def parse(self, bits: bytes) -> Any:
     """Parses the given bits into a python object.
 
     Arguments
-    :param bits: A :class:`bytes` object where every byte is a 0 or a 1 to represent individual bits.
-    
+    :param bits: A bytes-like object (:class:`bytes` or :class:`memoryview`) where every byte is a 0 or a 1 to represent individual bits.
+
     :return: A python object."""
     raise NotImplementedError("SpecType.parse not implemented.")
 
+  def parse_bytes(self, raw: bytes) -> Any:
+    """Parse a whole-byte read from its raw packed form. The default implementation expands the bytes into bit form and defers to parse; byte-aligned SpecTypes can override this to skip the bit expansion entirely.
+
+    Arguments
+    :param raw: The raw :class:`bytes` read from the stream.
+
+    :return: A python object."""
+    return self.parse(expand_bits(raw))
+
+
+# struct format characters for fixed-size unsigned integers, by byte width.
+_INT_CODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
 
 class Int(SpecType):
   """:class:`SpecType` which parses an integer of the given size in bits and bytes. The resulting integer is `bytes * 8 + bits` bits long. Parses as a python integer.
@@ -33,49 +49,80 @@ class Int(SpecType):
 
   Keyword Arguments
   :param big_endian: Flag whether to parse the integer with big or little endianness, big endian being right-to-left and little endian left-to-right."""
+  # Fixed-width subclasses precompile their struct format as a class
+  # attribute; the generic Int has no static width to compile against.
+  _struct = None
+
   def __init__(self, bytes: int=0, bits: int=0, *, big_endian: bool=True):
-    self.__bit_length = bits + bytes * 8
+    self.bit_length = bits + bytes * 8
     self.big_endian = big_endian
 
-  def get_bit_length(self) -> int:
-    return self.__bit_length
-  
-  def parse(self, bits: bytes):
-    return bits_to_int(bits, big_endian=self.big_endian)
+    # Endianness never changes after construction, so bind the matching
+    # decoders once here instead of re-branching on big_endian every parse.
+    if big_endian:
+      self.parse = self.__parse_be
+      self.parse_bytes = self.__parse_struct if self._struct is not None else self.__parse_bytes_be
+    else:
+      self.parse = self.__parse_le
+      self.parse_bytes = self.__parse_bytes_le
+
+  def __parse_be(self, bits: bytes) -> int:
+    return bits_to_int(bits)
+
+  def __parse_le(self, bits: bytes) -> int:
+    return bits_to_int(bits, big_endian=False)
+
+  def __parse_struct(self, raw: bytes) -> int:
+    return self._struct.unpack(raw)[0]
+
+  def __parse_bytes_be(self, raw: bytes) -> int:
+    return int.from_bytes(raw, "big")
+
+  def __parse_bytes_le(self, raw: bytes) -> int:
+    # Little endian reverses the whole bit sequence, not just byte order.
+    return int.from_bytes(reverse_bits(raw), "big")
 
 
 class Int8(Int):
   """:class:`SpecType` which parses an 8-bit integer.
-  
+
   Keyword Arguments
   :param big_endian: Flag whether to parse the integer with big or little endianness, big endian being right-to-left and little endian left-to-right."""
+  _struct = struct.Struct(">B")
+
   def __init__(self, *, big_endian: bool=True):
     super().__init__(bytes=1, big_endian=big_endian)
 
 
 class Int16(Int):
   """:class:`SpecType` which parses a 16-bit integer.
-  
+
   Keyword Arguments
   :param big_endian: Flag whether to parse the integer with big or little endianness, big endian being right-to-left and little endian left-to-right."""
+  _struct = struct.Struct(">H")
+
   def __init__(self, *, big_endian: bool=True):
     super().__init__(bytes=2, big_endian=big_endian)
 
 
 class Int32(Int):
   """:class:`SpecType` which parses a 32-bit integer.
-  
+
   Keyword Arguments
   :param big_endian: Flag whether to parse the integer with big or little endianness, big endian being right-to-left and little endian left-to-right."""
+  _struct = struct.Struct(">I")
+
   def __init__(self, *, big_endian: bool=True):
     super().__init__(bytes=4, big_endian=big_endian)
 
 
 class Int64(Int):
   """:class:`SpecType` which parses a 64-bit integer.
-  
+
   Keyword Arguments
   :param big_endian: Flag whether to parse the integer with big or little endianness, big endian being right-to-left and little endian left-to-right."""
+  _struct = struct.Struct(">Q")
+
   def __init__(self, *, big_endian: bool=True):
     super().__init__(bytes=8, big_endian=big_endian)
 
@@ -92,14 +139,21 @@ class String(SpecType):
     self.encoding = encoding
     self.length = length
     self.big_endian = big_endian
+    self.bit_length = 8 * length
 
-  def get_bit_length(self) -> int:
-    return 8 * self.length
+    # Resolve the codec once instead of looking it up by name on every parse.
+    self._decode = codecs.lookup(encoding).decode
 
   def parse(self, bits: bytes) -> str:
-    bytes = bits_to_bytes(bits, big_endian=self.big_endian)
+    data = bits_to_bytes(bits, big_endian=self.big_endian)
+
+    return self._decode(data)[0]
 
-    return bytes.decode(self.encoding)
+  def parse_bytes(self, raw: bytes) -> str:
+    if self.big_endian:
+      return self._decode(raw)[0]
+
+    return self._decode(reverse_bits(raw))[0]
 
 
 class Packed(SpecType):
@@ -112,12 +166,113 @@ class Packed(SpecType):
   :param names: A list of names corresponding to the `spec_types` argument. If this argument is set, a dictionary will be returned instead of an array with each name as a key and the corresponding parsed value as the value. Must be the same length as `spec_types`.
   """
   def __init__(self, spec_types: list[SpecType], *, names: Union[list[str], None]=None):
-    if names is not None and len(spec_types) != len(names):
-      raise SpecTypeError("spec_types and names must be the same length.", self)
+    spec_types = list(spec_types)
+
+    # Materialize names once; from_dict hands over a live dict_keys view.
+    if names is not None:
+      names = tuple(names)
+
+      if len(spec_types) != len(names):
+        raise SpecTypeError("spec_types and names must be the same length.", self)
 
     self.spec_types = [(spec, spec.get_bit_length()) for spec in spec_types]
     self.names = names
 
+    # Parallel tuples of the specs and their cumulative bit offsets so parse
+    # can slice without unpacking tuples or keeping a running total.
+    self._specs = tuple(spec_types)
+    self._offsets = tuple(accumulate((s.get_bit_length() for s in spec_types), initial=0))
+
+    self.bit_length = self._offsets[-1]
+
+    # When every child is a whole number of bytes, the raw read can be cut at
+    # byte offsets and handed to the children without any bit expansion.
+    if all(spec.get_bit_length() % 8 == 0 for spec in self._specs):
+      self._byte_offsets = tuple(offset // 8 for offset in self._offsets)
+    else:
+      self._byte_offsets = None
+
+    self._parse = self.__compile_parse()
+    self._parse_raw = self.__compile_parse_raw() if self._byte_offsets is not None else None
+    self.__struct = self.__compile_struct()
+
+  def __compile_struct(self) -> Union[struct.Struct, None]:
+    # A Packed of fixed-size big endian Ints, Bytes and whole-byte Bools maps
+    # onto a struct format, letting parse_bytes decode every field in one call.
+    codes = []
+
+    for spec in self._specs:
+      if isinstance(spec, Int) and spec.big_endian:
+        item_bytes, leftover = divmod(spec.bit_length, 8)
+
+        if leftover != 0 or item_bytes not in _INT_CODES:
+          return None
+
+        codes.append(_INT_CODES[item_bytes])
+      elif isinstance(spec, Bytes) and spec.big_endian:
+        codes.append(f"{spec.count}s")
+      elif isinstance(spec, Bool) and not spec.single_bit:
+        codes.append("?")
+      else:
+        return None
+
+    return struct.Struct(">" + "".join(codes))
+
+  def __compile_parse(self) -> Callable:
+    # The schema is frozen at construction, so generate a straight-line parse
+    # function with literal slice bounds instead of interpreting the spec list
+    # on every call. The child specs are bound as default arguments.
+    offsets = self._offsets
+
+    if self._specs and all(isinstance(spec, Int) and spec.big_endian for spec in self._specs):
+      # A record of big endian Ints converts to one integer and every field
+      # is a literal shift-and-mask of that word, so no child slices or
+      # parses its own bits at all.
+      total = self.bit_length
+      terms = (
+          f"(_n >> {total - offsets[i + 1]}) & {(1 << (offsets[i + 1] - offsets[i])) - 1}"
+          for i in range(len(self._specs)))
+
+      return self.__compile_terms(terms, prelude="  _n = _to_int(bits)\n", extra={"_to_int": bits_to_int})
+
+    terms = (
+        f"_s{i}.parse(bits[{offsets[i]}:{offsets[i + 1]}])"
+        for i in range(len(self._specs)))
+
+    return self.__compile_terms(terms)
+
+  def __compile_parse_raw(self) -> Callable:
+    # Same straight-line specialization as __compile_parse, but cutting the
+    # raw byte windows for the children's parse_bytes.
+    offsets = self._byte_offsets
+    terms = (
+        f"_s{i}.parse_bytes(bits[{offsets[i]}:{offsets[i + 1]}])"
+        for i in range(len(self._specs)))
+
+    return self.__compile_terms(terms)
+
+  def __compile_terms(self, terms, prelude: str="", extra: Union[dict, None]=None) -> Callable:
+    params = "".join(f", _s{i}=_s{i}" for i in range(len(self._specs)))
+    namespace = {f"_s{i}": spec for i, spec in enumerate(self._specs)}
+
+    if extra is not None:
+      namespace.update(extra)
+
+    # Named Packeds build their result dict in the same pass as the field
+    # parses, skipping the intermediate values list and the zip. The names
+    # are bound as defaults alongside the specs.
+    if self.names is None:
+      body = f"[{', '.join(terms)}]"
+    else:
+      params += "".join(f", _n{i}=_n{i}" for i in range(len(self._specs)))
+      namespace.update((f"_n{i}", name) for i, name in enumerate(self.names))
+      body = "{" + ", ".join(f"_n{i}: {term}" for i, term in enumerate(terms)) + "}"
+
+    source = f"def _parse(bits{params}):\n{prelude}  return {body}"
+    exec(compile(source, "<packed>", "exec"), namespace)
+
+    return namespace["_parse"]
+
   @staticmethod
   def from_kwargs(**kwargs: dict[str, SpecType]) -> "Packed":
     """Created a :class:`Packed` from keyword arguments. Argument values must be :class:`SpecType`s. This will result in a dictionary being parsed with the parsed values of the :class:`SpecType`s as values."""
@@ -128,23 +283,55 @@ class Packed(SpecType):
     """Created a :class:`Packed` from a dictionary of name-SpecType pairs. Dictionary values must be :class:`SpecType`s. This will result in a dictionary being parsed with the parsed values of the :class:`SpecType`s as values."""
     return Packed(d.values(), names=d.keys())
 
-  def get_bit_length(self) -> int:
-    return sum([t[1] for t in self.spec_types])
+  def parse(self, bits: bytes) -> Any:
+    # One memoryview wrap up front makes every child's slice a zero-copy
+    # window instead of a fresh bytes allocation.
+    return self._parse(memoryview(bits))
 
-  def parse(self, bits: bytes) -> list:
-    values = []
-    i = 0
+  def parse_many(self, bits: bytes, count: int) -> Any:
+    """Parse `count` back-to-back records from the given bits into columns, one list per field, instead of one container per record. Iterating fields outermost hoists the per-field dispatch out of the record loop and skips the per-record allocations.
 
-    for spec_type, bit_length in self.spec_types:
-      bit_slice = bits[i:i + bit_length]
-      values.append(spec_type.parse(bit_slice))
-      i += bit_length
+    Arguments
+    :param bits: Bits covering `count` consecutive records, as passed to parse.
+    :param count: Number of records to parse.
+
+    :return: A list of columns in field order, or a dictionary of columns keyed by name if names were given."""
+    if isinstance(bits, BitsView):
+      bits = bytes(bits)
+
+    view = memoryview(bits)
+    record_length = self.bit_length
+    offsets = self._offsets
+    columns = []
+
+    # A zero-width record still yields count (empty) rows per field.
+    bases = range(0, count * record_length, record_length) if record_length else (0,) * count
+
+    for i, spec in enumerate(self._specs):
+      parse = spec.parse
+      start = offsets[i]
+      stop = offsets[i + 1]
+      columns.append([parse(view[base + start:base + stop]) for base in bases])
 
     if self.names is None:
-      return values
-    else:
+      return columns
+
+    return dict(zip(self.names, columns))
+
+  def parse_bytes(self, raw: bytes) -> Any:
+    if self.__struct is not None:
+      values = self.__struct.unpack(raw)
+
+      if self.names is None:
+        return list(values)
+
       return dict(zip(self.names, values))
 
+    if self._parse_raw is None:
+      return super().parse_bytes(raw)
+
+    return self._parse_raw(memoryview(raw))
+
 
 class Bool(SpecType):
   """:class:`SpecType` which parses a boolean.
@@ -155,15 +342,19 @@ class Bool(SpecType):
   :return: False if the read byte (or bit) is 0, otherwise True."""
   def __init__(self, *, single_bit: bool=False):
     self.single_bit = single_bit
-
-  def get_bit_length(self) -> int:
-    return 1 if self.single_bit else 8
+    self.bit_length = 1 if single_bit else 8
 
   def parse(self, bits: bytes) -> bool:
     if self.single_bit:
       return bits[0] != 0
     else:
-      return any(b != 0 for b in bits) != 0
+      return any(bits)
+
+  def parse_bytes(self, raw: bytes) -> bool:
+    if self.single_bit:
+      return super().parse_bytes(raw)
+
+    return raw[0] != 0
 
 
 class Bytes(SpecType):
@@ -177,27 +368,83 @@ class Bytes(SpecType):
   def __init__(self, count: int, *, big_endian: bool=True):
     self.count = count
     self.big_endian = big_endian
-
-  def get_bit_length(self) -> int:
-    return self.count * 8
+    self.bit_length = count * 8
 
   def parse(self, bits: bytes) -> bytes:
     return bits_to_bytes(bits, big_endian=self.big_endian)
 
+  def parse_bytes(self, raw: bytes) -> bytes:
+    if self.big_endian:
+      # bytes(raw) is a no-op for bytes input and materializes memoryview
+      # windows handed down by Packed/Array.
+      return bytes(raw)
+
+    return reverse_bits(raw)
+
+
+class BitsView:
+  """Lazy view of the bits of a packed :class:`bytes` object, as returned by :class:`Bits` for byte-aligned reads. Indexing and iterating yield 0/1 integers like the expanded bytes form, but nothing is expanded until it is actually touched; bytes(view) materializes the full expanded form."""
+  __slots__ = ("__raw",)
+
+  def __init__(self, raw: bytes):
+    self.__raw = raw
+
+  def __len__(self) -> int:
+    return len(self.__raw) * 8
+
+  def __getitem__(self, index: Union[int, slice]) -> Union[int, bytes]:
+    if isinstance(index, slice):
+      return expand_bits(self.__raw)[index]
+
+    if index < 0:
+      index += len(self.__raw) * 8
+
+    if not 0 <= index < len(self.__raw) * 8:
+      raise IndexError("bit index out of range")
+
+    return (self.__raw[index >> 3] >> (7 - (index & 7))) & 1
+
+  def __iter__(self):
+    return iter(expand_bits(self.__raw))
+
+  def __bytes__(self) -> bytes:
+    return expand_bits(self.__raw)
+
+  def __eq__(self, other: Any) -> bool:
+    if isinstance(other, BitsView):
+      return self.__raw == other.__raw
+
+    if isinstance(other, (bytes, bytearray, memoryview)):
+      return expand_bits(self.__raw) == other
+
+    return NotImplemented
+
+  def __hash__(self) -> int:
+    # Hash like the expanded bytes this view compares equal to, so mixed
+    # dict keys and set members behave consistently.
+    return hash(expand_bits(self.__raw))
+
+  def __repr__(self) -> str:
+    return f"BitsView({self.__raw!r})"
+
 
 class Bits(SpecType):
-  """SpecType to read the given number of bits. Parses as a :class:`bytes` object wherin every byte is a 1 or 0.
-  
+  """SpecType to read the given number of bits. Parses as a sequence of 0/1 values: a lazy :class:`BitsView` for byte-aligned reads, otherwise a :class:`bytes` object wherin every byte is a 1 or 0.
+
   Arguments:
   :param count: Number of bits to read."""
   def __init__(self, count: int):
     self.bit_length = count
 
-  def get_bit_length(self) -> int:
-    return self.bit_length
-
   def parse(self, bits: bytes) -> bytes:
-    return bits
+    # Packed, Array and expect_many hand down memoryview windows;
+    # materialize so callers get the documented bytes form.
+    return bits if isinstance(bits, bytes) else bytes(bits)
+
+  def parse_bytes(self, raw: bytes) -> BitsView:
+    # A byte-aligned read keeps the packed form and serves bits on demand,
+    # skipping the 8x expansion unless the caller materializes it.
+    return BitsView(bytes(raw))
 
 
 class Array(SpecType):
@@ -210,15 +457,73 @@ class Array(SpecType):
     self.spec_type = spec_type
     self.length = length
     self.__item_length = self.spec_type.get_bit_length()
-
-  def get_bit_length(self) -> int:
-    return self.__item_length * self.length
+    self.bit_length = self.__item_length * length
+
+    # Arrays of fixed-size integers (and whole-byte Bools) unpack in a
+    # single struct call instead of one parse dispatch per element.
+    self.__struct = None
+    self.__struct_translate = None
+
+    if isinstance(spec_type, Int):
+      item_bytes, leftover = divmod(self.__item_length, 8)
+
+      if leftover == 0 and item_bytes in _INT_CODES:
+        if spec_type.big_endian:
+          self.__struct = struct.Struct(f">{length}{_INT_CODES[item_bytes]}")
+        else:
+          # Reversing the bits of every byte with one translate and reading
+          # the result as '<' words equals reversing each element's whole
+          # bit sequence, so even little endian arrays unpack in one call.
+          self.__struct = struct.Struct(f"<{length}{_INT_CODES[item_bytes]}")
+          self.__struct_translate = _BITREV
+    elif isinstance(spec_type, Bool) and not spec_type.single_bit:
+      self.__struct = struct.Struct(f">{length}?")
+
+    # Arrays of single-bit Bools map one bit byte to one bool, which a
+    # single C-level map covers without any per-element dispatch.
+    self.__bit_bools = isinstance(spec_type, Bool) and spec_type.single_bit
+
+    # Sub-byte big endian Ints decode the whole window as one integer and
+    # mask the elements out of it, instead of slicing and parsing each one.
+    self.__bit_ints = (
+        isinstance(spec_type, Int) and spec_type.big_endian
+        and self.__item_length % 8 != 0)
+
+  def parse_bytes(self, raw: bytes) -> Any:
+    if self.__struct is not None:
+      if self.__struct_translate is not None:
+        raw = bytes(raw).translate(self.__struct_translate)
+
+      return list(self.__struct.unpack(raw))
+
+    # Whole-byte elements parse from byte windows of the raw read; only
+    # sub-byte elements need the bit expansion.
+    if self.__item_length % 8 == 0:
+      item_bytes = self.__item_length // 8
+      view = memoryview(raw)
+      parse_bytes = self.spec_type.parse_bytes
+
+      return [parse_bytes(view[i * item_bytes:(i + 1) * item_bytes]) for i in range(self.length)]
+
+    return super().parse_bytes(raw)
 
   def parse(self, bits: bytes) -> Any:
-    values = []
+    if self.__bit_bools:
+      return list(map(bool, bits))
+
+    if self.__bit_ints:
+      width = self.__item_length
+      mask = (1 << width) - 1
+      n = bits_to_int(bits)
+
+      return [(n >> shift) & mask for shift in range((self.length - 1) * width, -1, -width)]
+
+    bits = memoryview(bits)
+    parse = self.spec_type.parse
+    item_length = self.__item_length
+    values = [None] * self.length
 
     for i in range(self.length):
-      slice = bits[i * self.__item_length:(i + 1) * self.__item_length]
-      values.append(self.spec_type.parse(slice))
+      values[i] = parse(bits[i * item_length:(i + 1) * item_length])
 
     return values
\ No newline at end of file
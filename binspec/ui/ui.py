@@ -123,6 +123,10 @@ html_template = """
 
 from ..spec import Specification
 
+# Maps a byte value to its 8-character binary string, so building the page's
+# binary string is one table lookup per byte instead of a format() call.
+_BIN_STR = [format(b, "08b") for b in range(256)]
+
 def show(spec: Specification, data: bytes, *, port: int=55791):
     """Show a webpage which visualizes the specification. This method depends on the given :class:`Specification`'s history tracking to be enabled. Addtionally requires Flask to be installed.
     
@@ -140,7 +144,7 @@ def show(spec: Specification, data: bytes, *, port: int=55791):
     def index():
         json_spec_template = "{ bit_length: %s, label: '%s' }"
         spec_history = ",".join(map(lambda s: json_spec_template % (s[0].get_bit_length(), s[2]), spec.get_history()))
-        binary_string = "".join(map(lambda b: format(b, '#010b'), stream.read()))
+        binary_string = "".join(map(_BIN_STR.__getitem__, data))
 
         from .ui import html_template
 
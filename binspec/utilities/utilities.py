@@ -1,4 +1,35 @@
-import math
+# Maps a byte value to the 8-byte bytes object of its individual bits,
+# e.g. _BIT_LUT[0b10100000] == b"\x01\x00\x01\x00\x00\x00\x00\x00".
+# Each entry is what the SWAR expansion ((b * 0x8040201008040201) &
+# 0x8080808080808080) >> 7 would compute per byte, precomputed once so the
+# hot path is a single table lookup.
+_BIT_LUT = [bytes((b >> (7 - i)) & 1 for i in range(8)) for b in range(256)]
+
+# Maps the bit values 0/1 to the ASCII characters "0"/"1".
+_ASCII_BITS = bytes.maketrans(b"\x00\x01", b"01")
+
+# Maps a byte value to its bit-reversed value, e.g. 0b00000011 -> 0b11000000.
+_BITREV = bytes(int(format(b, "08b")[::-1], 2) for b in range(256))
+
+
+def reverse_bits(data: bytes) -> bytes:
+  """Reverse the bit order of the given packed bytes as one continuous sequence, so the first bit of the first byte becomes the last bit of the last byte.
+
+  Arguments
+  :param data: bytes-like object to reverse.
+
+  :return: A :class:`bytes` with the bit sequence reversed."""
+  return bytes(data)[::-1].translate(_BITREV)
+
+
+def expand_bits(data: bytes) -> bytes:
+  """Expand packed bytes into the bits form used by :class:`SpecType`.parse, a :class:`bytes` object where every byte is a 0 or a 1.
+
+  Arguments
+  :param data: bytes object to expand.
+
+  :return: A :class:`bytes` of 0/1 values, 8 per input byte."""
+  return b"".join(map(_BIT_LUT.__getitem__, data))
 
 
 def bits_to_bytes(bits: bytes, *, big_endian: bool=True) -> bytes:
@@ -11,54 +42,40 @@ def bits_to_bytes(bits: bytes, *, big_endian: bool=True) -> bytes:
   :param big_endian: Flag whether to create a big endian :class:`bytes` object.
   
   :return: A :class:`bytes` containing the given bits as if they were compressed."""
-  byte_count = math.ceil(len(bits) / 8)
-  b = bytearray()
+  if len(bits) == 0:
+    return b""
+
+  byte_count = (len(bits) + 7) >> 3
 
   if not big_endian:
-    bits = list(reversed(bits))
-  
-  for i in range(0, byte_count * 8, 8):
-    byte = 0
-
-    for j in range(8):
-      byte <<= 1
-      
-      if (i + j) >= len(bits):
-        # this is a theoretically impossible edge case
-        break # break out because we don't have any bits left 
-      else:
-        if bits[i + j] == 0:
-          pass # bit shift adds the zero
-        else:
-          byte |= 1
-
-        if (i + j + 1) >= len(bits):
-          break # avoid extra bit shift since this is the last bit
-    
-    b.append(byte)
-
-  if byte_count > 1 and (len(bits) % 8) != 0: # this whole section shifts everything to the right to remove the trailing zeros on the most significant byte
-    excess_count = len(bits) % 8
-    b[-1] <<= excess_count
-
-    create_pairs = lambda l: ((l[i], l[i + 1], i, i + 1) for i in range(len(l) - 1)) # adjacent pairwise from list
-    shifted_b = bytearray(len(b))
-
-    for byte_right, byte_left, byte_right_index, byte_left_index in create_pairs(list(reversed(b))):
-      for i in range(excess_count):
-        byte_right >>= 1
-
-        if (byte_left & 1) != 0:
-          byte_right |= 128
-
-        byte_left >>= 1
-      
-      shifted_b[byte_right_index] = byte_right
-      shifted_b[byte_left_index] = byte_left
-  
-    b = bytearray(reversed(shifted_b))
-  
-  return bytes(b)
+    # A C-level slice copy; going through reversed() would build a Python
+    # list of 8x boxed ints just to throw it away.
+    bits = bytes(bits)[::-1]
+
+  # Translating the 0/1 bytes to ASCII "0"/"1" and parsing base 2 packs the
+  # whole buffer in C, right-aligned into byte_count bytes. Note this also
+  # fixes the old per-bit loop, which mis-packed non-byte-aligned inputs
+  # wider than 8 bits (left-shifting the partial byte past the rest, or
+  # overflowing bytes outright) instead of right-aligning the value.
+  n = int(bytes(bits).translate(_ASCII_BITS), 2)
+
+  return n.to_bytes(byte_count, "big")
+
+
+def extract_int(data: bytes, bit_offset: int, bit_length: int) -> int:
+  """Extract a big endian integer of `bit_length` bits starting `bit_offset` bits into the given packed bytes, without expanding anything. Only the bytes the field touches are read; they decode with one int.from_bytes plus a shift and mask.
+
+  Arguments
+  :param data: Packed bytes-like object to read from.
+  :param bit_offset: Position of the field's first bit, counting from the most significant bit of the first byte.
+  :param bit_length: Number of bits in the field.
+
+  :return: The field's value as a non-negative integer."""
+  start = bit_offset >> 3
+  end = (bit_offset + bit_length + 7) >> 3
+  word = int.from_bytes(data[start:end], "big")
+
+  return (word >> ((end << 3) - bit_offset - bit_length)) & ((1 << bit_length) - 1)
 
 
 def bits_to_int(bits: bytes, *, big_endian: bool=True) -> int:
@@ -71,7 +88,12 @@ def bits_to_int(bits: bytes, *, big_endian: bool=True) -> int:
   :param big_endian: Flag whether to read the given bits in big endian or little endian order.
   
   :return: An n-bit integer from the given bits."""
-  b = bits_to_bytes(bits, big_endian=big_endian)
-  n = int.from_bytes(b, byteorder="big")
+  if len(bits) == 0:
+    return 0
+
+  if not big_endian:
+    bits = bytes(bits)[::-1]
 
-  return n
\ No newline at end of file
+  # Parse the bit string directly instead of packing it into bytes first;
+  # both the translate and the base-2 parse run in C over the whole buffer.
+  return int(bytes(bits).translate(_ASCII_BITS), 2)
\ No newline at end of file
@@ -4,16 +4,12 @@ from io import BytesIO
 import binspec
 from binspec import Specification
 from binspec.types import SpecType, Int, String, Array, Bool, Packed, Bits, Bytes
+from binspec.utilities import extract_int
 from binspec.errors import SpecError, SpecTypeError, SpecEofError
 
 
 def create_specification(*byte_params: list[bytes]):
-    data = bytearray()
-    for b in byte_params:
-        if isinstance(b, bytes):
-            data += b
-        else:
-            data.append(b)
+    data = b"".join(b if isinstance(b, bytes) else bytes((b,)) for b in byte_params)
     return Specification(BytesIO(data))
 
 
@@ -84,6 +80,12 @@ class IntTests(unittest.TestCase):
 
         self.assertEqual(n, 51)
 
+    def testIntBitsAndBytesHighBitsSet(self):
+        my_spec = create_specification(0b10000000, 0b10010000)
+        n = my_spec.expect(Int(bytes=1, bits=4))
+
+        self.assertEqual(n, 0b100000001001)
+
     def testIntBitsAndBytesLittleEndian(self):
         my_spec = create_specification(0b00000011, 0b00110000)
         n = my_spec.expect(Int(bytes=1, bits=4, big_endian=False))
@@ -152,6 +154,17 @@ class PackedTests(unittest.TestCase):
 
         self.assertEqual(packed, { "a": 3, "b": 3, "c": [False, False] })
 
+    def testParseManyColumns(self):
+        my_spec = create_specification(0b11001100, 0b00110011)
+        packed = Packed([Int(bits=2), Int(bits=6)], names=["a", "b"])
+        columns = packed.parse_many(my_spec.expect(Bits(16)), 2)
+
+        self.assertEqual(columns, { "a": [3, 0], "b": [0b001100, 0b110011] })
+
+    def testParseManyZeroWidth(self):
+        self.assertEqual(Packed([]).parse_many(b"", 3), [])
+        self.assertEqual(Packed([Array(Int(bytes=1), 0)]).parse_many(b"", 2), [[[], []]])
+
 
 class BooleanTests(unittest.TestCase):
     def testSingleBitBool(self):
@@ -186,6 +199,45 @@ class BitsTests(unittest.TestCase):
 
         self.assertEqual([0 if b == 0 else 1 for b in bits], [ 1, 1, 0, 0 ])
 
+    def testBitsLazyView(self):
+        my_spec = create_specification(0b11000011)
+        bits = my_spec.expect(Bits(8))
+
+        self.assertEqual(len(bits), 8)
+        self.assertEqual(bits[0], 1)
+        self.assertEqual(bits[-1], 1)
+        self.assertEqual(bytes(bits), b"\x01\x01\x00\x00\x00\x00\x01\x01")
+
+
+class ExpectManyTests(unittest.TestCase):
+    def testExpectMany(self):
+        my_spec = create_specification(0b11001100, 0b10100101)
+        values = my_spec.expect_many([ Int(bits=2), Int(bits=4), Array(Bool(single_bit=True), length=2), Int(bytes=1) ])
+
+        self.assertEqual(values, [3, 3, [False, False], 0b10100101])
+
+    def testExpectManyLabels(self):
+        my_spec = create_specification(0b11001100)
+        my_spec.expect_many([ Int(bits=4), Int(bits=4) ], labels=[ "high", "low" ])
+
+        self.assertEqual([h[2] for h in my_spec.get_history()], [ "high", "low" ])
+
+    def testExpectManyNoneAtEof(self):
+        my_spec = create_specification(0b11001100)
+
+        self.assertIsNone(my_spec.expect_many([ Int(bytes=1), Int(bytes=1) ], none_at_eof=True))
+
+
+class ExtractIntTests(unittest.TestCase):
+    def testExtractIntWithinByte(self):
+        self.assertEqual(extract_int(bytes([0b01101000]), 1, 3), 0b110)
+
+    def testExtractIntStraddlingBytes(self):
+        self.assertEqual(extract_int(bytes([0b00000001, 0b11000000]), 4, 6), 0b000111)
+
+    def testExtractIntWholeBuffer(self):
+        self.assertEqual(extract_int(b"\x12\x34", 0, 16), 0x1234)
+
 
 class ReadmeTests(unittest.TestCase):
     def testBytesAsAString(self):